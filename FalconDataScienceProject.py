@@ -45,6 +45,7 @@ ongoing conversation on educational equity and inclusivity.
 # Importing the necessary libraries 
 import numpy as np  # For numerical operations
 import pandas as pd  # For data manipulation and analysis
+import pyarrow  # For writing Feather files for the R analysis (used by DataFrame.to_feather)
 
 import matplotlib.pyplot as plt  # For data visualization
 import seaborn as sns  # For enhanced data visualization
@@ -374,27 +375,54 @@ pass_rates.info()
 # In[19]:
 
 
-forms = forms.rename(columns={'Unnamed: 0': 'Year', 'L6': 'L6_Male', 'Unnamed: 2': 'L6_Female', 'U6': 'U6_Male', 'Unnamed: 4': 'U6_Female'})
-forms = forms.drop(0)
+def clean_forms(forms):
+    # Rename the columns and drop the Male/Female sub-header row
+    forms = forms.rename(columns={'Unnamed: 0': 'Year', 'L6': 'L6_Male', 'Unnamed: 2': 'L6_Female', 'U6': 'U6_Male', 'Unnamed: 4': 'U6_Female'})
+    return forms.drop(0)
+
+
+forms = clean_forms(forms)
 forms.head(10)
 
 
 # In[20]:
 
 
-pass_rates = pass_rates.rename(columns={'SUBJECT PASS RATES %': 'Year', 'Unnamed: 1': 'IGCSE', 'Unnamed: 2': 'AS', 'Unnamed: 3': 'A Level'})
-pass_rates = pass_rates.drop(0)
+def clean_pass_rates(pass_rates):
+    # Rename the columns and drop the IGCSE/AS/A Level sub-header row
+    pass_rates = pass_rates.rename(columns={'SUBJECT PASS RATES %': 'Year', 'Unnamed: 1': 'IGCSE', 'Unnamed: 2': 'AS', 'Unnamed: 3': 'A Level'})
+    return pass_rates.drop(0)
+
+
+pass_rates = clean_pass_rates(pass_rates)
 pass_rates.head(10)
 
 
 # In[21]:
 
 
-# Merge the "forms" and "pass_rates" DataFrames based on the "Year" column
-merged_data = forms.merge(pass_rates, on ='Year')
+def merge_forms_and_pass_rates(forms, pass_rates, on='Year'):
+    # Merge the "forms" and "pass_rates" DataFrames based on the "Year" column
+    merged_data = forms.merge(pass_rates, on=on)
+
+    # Convert columns to numeric data types before adding them up (the CSV columns are read as text)
+    numeric_columns = ['L6_Male', 'L6_Female', 'U6_Male', 'U6_Female', 'IGCSE', 'AS', 'A Level']
+    merged_data[numeric_columns] = merged_data[numeric_columns].apply(pd.to_numeric)
+
+    merged_data['Total_L6'] = merged_data['L6_Male'] + merged_data['L6_Female']
+    merged_data['Total_U6'] = merged_data['U6_Male'] + merged_data['U6_Female']
+
+    # Calculate pass rates for Lower 6 Male and Female
+    merged_data['PassRate_L6_Male'] = (merged_data['L6_Male'] / merged_data['Total_L6']) * merged_data['AS']
+    merged_data['PassRate_L6_Female'] = (merged_data['L6_Female'] / merged_data['Total_L6']) * merged_data['AS']
+
+    # Calculate pass rates for Upper 6 Male and Female
+    merged_data['PassRate_U6_Male'] = (merged_data['U6_Male'] / merged_data['Total_U6']) * merged_data['A Level']
+    merged_data['PassRate_U6_Female'] = (merged_data['U6_Female'] / merged_data['Total_U6']) * merged_data['A Level']
+    return merged_data
+
 
-merged_data['Total_L6'] = merged_data['L6_Male'] + merged_data['L6_Female']
-merged_data['Total_U6'] = merged_data['U6_Male'] + merged_data['U6_Female']
+merged_data = merge_forms_and_pass_rates(forms, pass_rates)
 
 plt.plot(merged_data['Year'], merged_data['IGCSE'], label ='IGCSE Pass Rate')
 plt.plot(merged_data['Year'], merged_data['AS'], label ='AS Pass Rate')
@@ -427,7 +455,7 @@ Although the pass rates remain relatively stable, there are minor fluctuations o
 
 The second graph showcases the enrollment trends for Lower 6 (L6) and Upper 6 (U6) students over the years.
 
-L6 Enrollment: The number of students enrolled in L6 remains relatively stable, with minor fluctuations observed over the years. The L6 enrollment ranges from 46 to 80 students, indicating a consistent intake of students in this phase of education.
+L6 Enrollment: The number of students enrolled in L6 remains relatively stable, with minor fluctuations observed over the years. The L6 enrollment ranges from 58 to 83 students, indicating a consistent intake of students in this phase of education.
 
 U6 Enrollment: U6 enrollment also shows some fluctuations but maintains a relatively steady trend. 
 
@@ -441,28 +469,6 @@ Additionally, the enrollment numbers for L6 and U6 students remain relatively st
 """
 
 
-# In[30]:
-
-
-# Convert columns to numeric data types
-merged_data['L6_Male'] = pd.to_numeric(merged_data['L6_Male'])
-merged_data['L6_Female'] = pd.to_numeric(merged_data['L6_Female'])
-merged_data['U6_Male'] = pd.to_numeric(merged_data['U6_Male'])
-merged_data['U6_Female'] = pd.to_numeric(merged_data['U6_Female'])
-merged_data['Total_L6'] = pd.to_numeric(merged_data['Total_L6'])
-merged_data['Total_U6'] = pd.to_numeric(merged_data['Total_U6'])
-merged_data['A Level'] = pd.to_numeric(merged_data['A Level'])
-merged_data['AS'] = pd.to_numeric(merged_data['AS'])
-
-# Calculate pass rates for Lower 6 Male and Female
-merged_data['PassRate_L6_Male'] = (merged_data['L6_Male'] / merged_data['Total_L6']) * merged_data['AS']
-merged_data['PassRate_L6_Female'] = (merged_data['L6_Female'] / merged_data['Total_L6']) * merged_data['AS']
-
-# Calculate pass rates for Upper 6 Male and Female
-merged_data['PassRate_U6_Male'] = (merged_data['U6_Male'] / merged_data['Total_U6']) * merged_data['A Level']
-merged_data['PassRate_U6_Female'] = (merged_data['U6_Female'] / merged_data['Total_U6']) * merged_data['A Level']
-
-
 # In[31]:
 
 
@@ -514,71 +520,65 @@ plt.legend()
 plt.show()
 
 
-# In[81]:
+# In[ ]:
 
 
-#R
-# Read the Forms.csv file
-forms <- read.csv("C:/Users/Olidia/Desktop/Projects/Falcon/Forms.csv")
+def write_merged_feather(merged_data, path):
+    # Saving the merged dataset to Feather (Arrow IPC) format to use with R
+    # Year is stored as an integer and 'A Level' renamed to match the R column names
+    merged_data = merged_data.rename(columns={'A Level': 'A_Level'}).reset_index(drop=True)
+    merged_data['Year'] = pd.to_numeric(merged_data['Year']).astype('int64')
+    merged_data.to_feather(path, compression='uncompressed')
 
-# Read the PassRates.csv file
-pass_rates <- read.csv("C:/Users/Olidia/Desktop/Projects/Falcon/PassRates.csv")
 
-# Rename columns in forms DataFrame
-colnames(forms) <- c('Year', 'L6_Male', 'L6_Female', 'U6_Male', 'U6_Female')
+write_merged_feather(merged_data, 'C:/Users/Olidia/Desktop/Projects/Falcon/merged_dataset.feather')
 
-# Drop the first row in forms DataFrame
-forms <- forms[-1, ]
 
-# Rename columns in pass_rates DataFrame
-colnames(pass_rates) <- c('Year', 'IGCSE', 'AS', 'A_Level')
+# In[81]:
 
-# Drop the first row in pass_rates DataFrame
-pass_rates <- pass_rates[-1, ]
 
+#R
+# Load the required packages
+library(arrow)
 
-# In[41]:
+# Load the merged dataset exported from Python (Feather file) into an R data frame
+# Stop if the totals do not add up, so a wrongly cleaned table is caught before the analysis
+load_merged_data <- function(path) {
+  merged_data <- arrow::read_feather(path)
+  stopifnot(
+    isTRUE(all.equal(merged_data$Total_L6, merged_data$L6_Male + merged_data$L6_Female)),
+    isTRUE(all.equal(merged_data$Total_U6, merged_data$U6_Male + merged_data$U6_Female))
+  )
+  merged_data
+}
 
+merged_data <- load_merged_data("C:/Users/Olidia/Desktop/Projects/Falcon/merged_dataset.feather")
 
-# Merge the "forms" and "pass_rates" DataFrames based on the "Year" column
-merged_data <- merge(forms, pass_rates, by = 'Year')
 
-# Convert columns to numeric data types
-merged_data$L6_Male <- as.numeric(merged_data$L6_Male)
-merged_data$L6_Female <- as.numeric(merged_data$L6_Female)
-merged_data$U6_Male <- as.numeric(merged_data$U6_Male)
-merged_data$U6_Female <- as.numeric(merged_data$U6_Female)
+# In[41]:
 
-# Create the "Total_L6" and "Total_U6" columns by summing the male and female counts
-merged_data$Total_L6 <- merged_data$L6_Male + merged_data$L6_Female
-merged_data$Total_U6 <- merged_data$U6_Male + merged_data$U6_Female
 
-# Print the merged data
+# View the data
+str(merged_data)
 print(merged_data)
 
 
 # In[57]:
 
 
-# Convert columns to numeric data types
-merged_data$Total_L6 <- as.numeric(merged_data$Total_L6)
-merged_data$Total_U6 <- as.numeric(merged_data$Total_U6)
-merged_data$A_Level <- as.numeric(merged_data$A_Level)
-merged_data$AS <- as.numeric(merged_data$AS)
-
-# Calculate pass rates
-merged_data$PassRate_L6_Male <- (merged_data$L6_Male / merged_data$Total_L6) * merged_data$AS
-merged_data$PassRate_U6_Male <- (merged_data$U6_Male / merged_data$Total_U6) * merged_data$A_Level
-
 # Compare pass rates before and after 2017
 pass_rate_before_2017 <- merged_data[merged_data$Year < 2017, ]
 pass_rate_after_2017 <- merged_data[merged_data$Year >= 2017, ]
 
 # Calculate the differences in pass rates
-merged_data$diff_L6_Male <- pass_rate_after_2017$PassRate_L6_Male - pass_rate_before_2017$PassRate_L6_Male
-merged_data$diff_U6_Male <- pass_rate_after_2017$PassRate_U6_Male - pass_rate_before_2017$PassRate_U6_Male
+# Pair the years before and after 2017 in order, up to the shorter of the two periods
+n_pairs <- min(nrow(pass_rate_before_2017), nrow(pass_rate_after_2017))
+pass_rate_diffs <- data.frame(
+  diff_L6_Male = head(pass_rate_after_2017$PassRate_L6_Male, n_pairs) - head(pass_rate_before_2017$PassRate_L6_Male, n_pairs),
+  diff_U6_Male = head(pass_rate_after_2017$PassRate_U6_Male, n_pairs) - head(pass_rate_before_2017$PassRate_U6_Male, n_pairs)
+)
 
-print(merged_data)
+print(pass_rate_diffs)
 
 
 # In[60]:
@@ -588,8 +588,8 @@ print(merged_data)
 #This will allow us to assess whether any significant differences exist in their performance.
 
 # Simple statistics for these variables
-summary(merged_data$diff_L6_Male)
-summary(merged_data$diff_U6_Male)
+summary(pass_rate_diffs$diff_L6_Male)
+summary(pass_rate_diffs$diff_U6_Male)
 
 
 # In[79]:
@@ -597,7 +597,7 @@ summary(merged_data$diff_U6_Male)
 
 # Box-plot and Histogram to get a graphical idea of the distributional properties
 # Combine L6 and U6 pass rate differences into a single vector
-diff_pass_rate <- c(merged_data$diff_L6_Male, merged_data$diff_U6_Male)
+diff_pass_rate <- c(pass_rate_diffs$diff_L6_Male, pass_rate_diffs$diff_U6_Male)
 
 # Create a box plot for the combined pass rate differences
 boxplot(diff_pass_rate, main = "Box Plot of Differences in Pass Rates")
@@ -624,7 +624,7 @@ lines(d$x, dnorm(d$x, mean(diff_pass_rate), sd(diff_pass_rate)), lwd = 2, col =
 
 
 #Findings:
-#Basing our conclusion of only the p-value of the Shapiro-Wilk test (p-value = 0.0987), we find that we do not reject the null
+#Basing our conclusion of only the p-value of the Shapiro-Wilk test (W = 0.95147, p-value = 0.6586), we find that we do not reject the null
 #hypothesis of normality (i.e., we will assume that the difference data values are from a normally distributed population.)
 #This conclusion is somewhat supported by the graphical output
 
@@ -641,7 +641,8 @@ t.test(diff_pass_rate, altrnative = "two.sided")
 # H0: There is no significant difference in the male pass rates before and after 2017 vs
 # HA: There is a significant difference in the male pass rates before and after 2017
 
-# Since the p-value of our test is 1.754e-07, which is less than the significance level of 0.05, we reject the null hypothesis
+# The t-test gives t = -5.0874 with df = 11 and a mean difference of -9.02 (95% CI -12.92 to -5.12).
+# Since the p-value of our test is 0.0003509, which is less than the significance level of 0.05, we reject the null hypothesis
 # that there is no significant difference in the male pass rates before and after 2017. Therefore, we assume there is a 
 # significant difference in the male pass rates before and after 2017.
 # This somewhat supports the visualisation of the male mean pass rates before and after 2017.
@@ -657,3 +658,73 @@ patterns globally, with various factors such as school closures, remote learning
 Further analysis and data beyond 2023 would be necessary to assess the influence of the COVID-19 pandemic on enrollment trends 
 """
 
+
+# In[ ]:
+
+
+# Optional benchmark (not part of the analysis, skip on a normal run): writes large test files to the Falcon data folder
+# Benchmark: loading large multi-school tables in R from the raw CSV files vs the Feather file
+# Build Forms.csv and PassRates.csv shaped tables for many schools, with the school name as an extra last column
+rng = np.random.default_rng(2017)
+bench_index = pd.MultiIndex.from_product([[f'School_{i}' for i in range(20000)], range(2011, 2024)],
+                                         names=['School', 'Year']).to_frame(index=False)
+n_rows = len(bench_index)
+
+bench_forms = pd.DataFrame({'Year': bench_index['Year'],
+                            'L6_Male': rng.integers(20, 60, n_rows), 'L6_Female': rng.integers(0, 30, n_rows),
+                            'U6_Male': rng.integers(20, 60, n_rows), 'U6_Female': rng.integers(0, 30, n_rows),
+                            'School': bench_index['School']})
+bench_pass_rates = pd.DataFrame({'Year': bench_index['Year'],
+                                 'IGCSE': rng.uniform(60, 100, n_rows).round(1), 'AS': rng.uniform(60, 100, n_rows).round(1),
+                                 'A Level': rng.uniform(60, 100, n_rows).round(1),
+                                 'School': bench_index['School']})
+
+# Raw CSV layout: a header row followed by a sub-header row, as in the original files
+bench_forms_raw = pd.concat([pd.DataFrame([['', 'Male', 'Female', 'Male', 'Female', '']], columns=bench_forms.columns),
+                             bench_forms.astype(str)])
+bench_forms_raw.to_csv('C:/Users/Olidia/Desktop/Projects/Falcon/bench_forms.csv', index=False,
+                       header=['', 'L6', '', 'U6', '', 'School'])
+bench_pass_rates_raw = pd.concat([pd.DataFrame([['', 'IGCSE', 'AS', 'A Level', '']], columns=bench_pass_rates.columns),
+                                  bench_pass_rates.astype(str)])
+bench_pass_rates_raw.to_csv('C:/Users/Olidia/Desktop/Projects/Falcon/bench_pass_rates.csv', index=False,
+                            header=['SUBJECT PASS RATES %', '', '', '', 'School'])
+
+# Build the Feather file from the raw CSV files through the same cleaning steps as merged_data
+bench_merged = merge_forms_and_pass_rates(
+    clean_forms(pd.read_csv('C:/Users/Olidia/Desktop/Projects/Falcon/bench_forms.csv', low_memory=False)),
+    clean_pass_rates(pd.read_csv('C:/Users/Olidia/Desktop/Projects/Falcon/bench_pass_rates.csv', low_memory=False)),
+    on=['School', 'Year'])
+write_merged_feather(bench_merged, 'C:/Users/Olidia/Desktop/Projects/Falcon/bench_merged.feather')
+
+
+# In[ ]:
+
+
+# Optional benchmark (continued)
+# Time the CSV route (read.csv, rename, drop sub-header row, merge, convert) against the Feather route
+# (arrow::read_feather into an R data frame plus the totals check in load_merged_data)
+csv_time <- system.time({
+  bench_forms <- read.csv("C:/Users/Olidia/Desktop/Projects/Falcon/bench_forms.csv")
+  colnames(bench_forms) <- c('Year', 'L6_Male', 'L6_Female', 'U6_Male', 'U6_Female', 'School')
+  bench_forms <- bench_forms[-1, ]
+
+  bench_pass_rates <- read.csv("C:/Users/Olidia/Desktop/Projects/Falcon/bench_pass_rates.csv")
+  colnames(bench_pass_rates) <- c('Year', 'IGCSE', 'AS', 'A_Level', 'School')
+  bench_pass_rates <- bench_pass_rates[-1, ]
+
+  bench_csv <- merge(bench_forms, bench_pass_rates, by = c('School', 'Year'))
+  for (column in c('Year', 'L6_Male', 'L6_Female', 'U6_Male', 'U6_Female', 'IGCSE', 'AS', 'A_Level')) {
+    bench_csv[[column]] <- as.numeric(bench_csv[[column]])
+  }
+  bench_csv$Total_L6 <- bench_csv$L6_Male + bench_csv$L6_Female
+  bench_csv$Total_U6 <- bench_csv$U6_Male + bench_csv$U6_Female
+  bench_csv$PassRate_L6_Male <- (bench_csv$L6_Male / bench_csv$Total_L6) * bench_csv$AS
+  bench_csv$PassRate_U6_Male <- (bench_csv$U6_Male / bench_csv$Total_U6) * bench_csv$A_Level
+})
+
+feather_time <- system.time({
+  bench_feather <- load_merged_data("C:/Users/Olidia/Desktop/Projects/Falcon/bench_merged.feather")
+})
+
+# Elapsed load time in seconds for each route
+print(rbind(CSV = csv_time, Feather = feather_time)[, "elapsed"])